@@ -203,6 +203,9 @@ def run_window_config(config_cls: WindowConfig, timer=None, args=None) -> None:
         vsync=values.vsync if values.vsync is not None else config_cls.vsync,
         samples=values.samples if values.samples is not None else config_cls.samples,
         cursor=show_cursor if show_cursor is not None else True,
+        single_buffer=values.single_buffer
+        if values.single_buffer is not None
+        else config_cls.single_buffer,
     )
     window.print_context_info()
     activate_context(window=window)
@@ -282,6 +285,12 @@ def create_parser():
         type=valid_bool,
         help="Enable or disable displaying the mouse cursor",
     )
+    parser.add_argument(
+        "-sb",
+        "--single_buffer",
+        type=valid_bool,
+        help="Enable or disable single buffered rendering",
+    )
     parser.add_argument(
         "--size", type=valid_window_size, help="Window size",
     )
@@ -10,6 +10,7 @@ WINDOW = {
     "vsync": True,
     "cursor": True,
     "samples": 0,
+    "single_buffer": False,
 }
 
 SCREENSHOT_PATH = None
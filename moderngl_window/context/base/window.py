@@ -87,6 +87,7 @@ class BaseWindow:
         aspect_ratio: float = None,
         samples=0,
         cursor=True,
+        single_buffer=False,
         **kwargs
     ):
         """Initialize a window instance.
@@ -102,6 +103,8 @@ class BaseWindow:
                                   aspect ratio be based on the actual window size.
             samples (int): Number of MSAA samples for the default framebuffer
             cursor (bool): Enable/disable displaying the cursor inside the window
+            single_buffer (bool): Render directly to the front buffer for lower latency.
+                                  Not supported by all window types.
         """
         # Window parameters
         self._title = title
@@ -114,6 +117,7 @@ class BaseWindow:
         self._fixed_aspect_ratio = aspect_ratio
         self._samples = samples
         self._cursor = cursor
+        self._single_buffer = single_buffer
         self._exit_key = self.keys.ESCAPE
         self._fs_key = self.keys.F11
 
@@ -382,6 +386,16 @@ class BaseWindow:
         """bool: vertical sync enabled/disabled"""
         return self._vsync
 
+    @property
+    def single_buffer(self) -> bool:
+        """bool: Single buffered rendering enabled/disabled.
+
+        The window renders directly to the front buffer instead
+        of swapping buffers. This can reduce input latency at the
+        cost of possible tearing. Not supported by all window types.
+        """
+        return self._single_buffer
+
     @property
     def aspect_ratio(self) -> float:
         """float: The current aspect ratio of the window.
@@ -641,6 +655,16 @@ class BaseWindow:
         """Returns: The press state of a key"""
         return self._key_pressed_map.get(key) is True
 
+    def is_any_pressed(self, keys) -> bool:
+        """Check if any of the supplied keys are pressed
+
+        Args:
+            keys: Sequence of key constants
+        Returns:
+            bool: True if at least one of the keys is pressed
+        """
+        return any(self.is_key_pressed(key) for key in keys)
+
     @property
     def is_closing(self) -> bool:
         """bool: Is the window about to close?"""
@@ -952,6 +976,16 @@ class WindowConfig:
         # Default value
         samples = 4
     """
+    single_buffer = False
+    """
+    Render directly to the front buffer instead of swapping buffers.
+    This can reduce input latency. Not supported by all window types.
+
+    .. code:: python
+
+        # Default value
+        single_buffer = False
+    """
     resource_dir = None
     """
     Absolute path to your resource directory containing textures, scenes,
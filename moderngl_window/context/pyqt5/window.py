@@ -1,10 +1,28 @@
+import sys
 from typing import Tuple
+
 from PyQt5 import QtCore, QtOpenGL, QtWidgets, QtGui
 
 from moderngl_window.context.base import BaseWindow
 from moderngl_window.context.pyqt5.keys import Keys
 
 
+class _EventFilter(QtCore.QObject):
+    """Forwards widget events to handlers looked up by event type"""
+
+    def __init__(self, handlers):
+        super().__init__()
+        self._handlers = handlers
+
+    def eventFilter(self, obj, event) -> bool:
+        handler = self._handlers.get(event.type())
+        if handler is not None:
+            handler(event)
+
+        # Let Qt run its default handling as well
+        return False
+
+
 class Window(BaseWindow):
     """
     A basic window implementation using PyQt5 with the goal of
@@ -21,23 +39,38 @@ class Window(BaseWindow):
     name = "pyqt5"
     #: PyQt5 specific key constants
     keys = Keys
-
-    # PyQt supports mode buttons, but we are limited by other libraries
-    _mouse_button_map = {
-        1: 1,
-        2: 2,
-        4: 3,
-    }
+    #: Maximum time in milliseconds spent processing Qt events each frame
+    event_time_budget = 2
+
+    # PyQt supports mode buttons, but we are limited by other libraries.
+    # Indexed by the Qt button (left=1, right=2, middle=4). 0 means unsupported
+    _mouse_button_lut = (0, 1, 2, 0, 3, 0, 0, 0)
+
+    # Modifier masks resolved once instead of on every input event
+    _SHIFT_MASK = int(QtCore.Qt.ShiftModifier)
+    _CTRL_MASK = int(QtCore.Qt.ControlModifier)
+    _ALT_MASK = int(QtCore.Qt.AltModifier)
+    # Converts wheel angle deltas to steps of 15 degrees
+    _WHEEL_SCALE = 1.0 / 120.0
+    # Longest time in milliseconds swap_buffers waits for events while hidden
+    _HIDDEN_WAIT_TIME = 100
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+        # Latest mouse position not yet forwarded. Move events are coalesced per frame
+        self._pending_mouse_pos = None
+        # Cleared by hide events, for example when the window is minimized
+        self._exposed = True
+
         # Specify OpenGL context parameters
         gl = QtOpenGL.QGLFormat()
         gl.setVersion(self.gl_version[0], self.gl_version[1])
         gl.setProfile(QtOpenGL.QGLFormat.CoreProfile)
         gl.setDepthBufferSize(24)
-        gl.setDoubleBuffer(True)
+        gl.setDoubleBuffer(not self.single_buffer)
+        # A swap interval of 0 keeps swapBuffers from blocking on vblank
+        # https://www.khronos.org/opengl/wiki/Swap_Interval
         gl.setSwapInterval(1 if self.vsync else 0)
 
         # Configure multisampling if needed
@@ -46,20 +79,31 @@ class Window(BaseWindow):
             gl.setSamples(int(self.samples))
 
         # We need an application object, but we are bypassing the library's
-        # internal event loop to avoid unnecessary work
-        self._app = QtWidgets.QApplication([])
-
-        # Create the OpenGL widget
+        # internal event loop to avoid unnecessary work.
+        # Reuse the application if the host process already created one.
+        self._app = QtWidgets.QApplication.instance()
+        self._owns_app = self._app is None
+        if self._owns_app:
+            self._app = QtWidgets.QApplication(sys.argv[:1])
+        screen = self._app.primaryScreen()
+
+        # Create the OpenGL widget.
+        # NOTE: QGLWidget is deprecated, but QOpenGLWidget is not a drop-in replacement.
+        # It renders into an FBO that Qt composes during its own paint events, has no
+        # swapBuffers() and leaves ctx.screen (framebuffer 0) pointing at nothing.
         self._widget = QtOpenGL.QGLWidget(gl)
         self.title = self._title
 
+        # The device pixel ratio is cached and refreshed when the window changes screen
+        self._dpr = self._widget.devicePixelRatio()
+
         # If fullscreen we change the window to match the desktop on the primary screen
         if self.fullscreen:
-            rect = QtWidgets.QDesktopWidget().screenGeometry()
+            rect = screen.geometry()
             self._width = rect.width()
             self._height = rect.height()
-            self._buffer_width = rect.width() * self._widget.devicePixelRatio()
-            self._buffer_height = rect.height() * self._widget.devicePixelRatio()
+            self._buffer_width = rect.width() * self._dpr
+            self._buffer_height = rect.height() * self._dpr
 
         if self.resizable:
             # Ensure a valid resize policy when window is resizable
@@ -73,11 +117,8 @@ class Window(BaseWindow):
 
         # Center the window on the screen if in window mode
         if not self.fullscreen:
-            center_window_position = (
-                self.position[0] - self.width / 2,
-                self.position[1] - self.height / 2,
-            )
-            self._widget.move(*center_window_position)
+            center = screen.availableGeometry().center()
+            self._widget.move(center - self._widget.rect().center())
 
         # Needs to be set before show()
         self._widget.resizeGL = self.resize
@@ -89,26 +130,45 @@ class Window(BaseWindow):
         else:
             self._widget.show()
 
+        # The native window exists after show. We can now track screen changes
+        window_handle = self._widget.windowHandle()
+        window_handle.screenChanged.connect(self._screen_changed)
+        self._screen_changed(window_handle.screen())
+
         # We want mouse position events
         self._widget.setMouseTracking(True)
 
-        # Override event functions in qt
-        self._widget.keyPressEvent = self.key_pressed_event
-        self._widget.keyReleaseEvent = self.key_release_event
-        self._widget.mouseMoveEvent = self.mouse_move_event
-        self._widget.mousePressEvent = self.mouse_press_event
-        self._widget.mouseReleaseEvent = self.mouse_release_event
-        self._widget.wheelEvent = self.mouse_wheel_event
-        self._widget.closeEvent = self.close_event
-        self._widget.showEvent = self.show_event
-        self._widget.hideEvent = self.hide_event
+        # Route the widget events we care about through a single event filter
+        self._event_filter = _EventFilter({
+            QtCore.QEvent.KeyPress: self.key_pressed_event,
+            QtCore.QEvent.KeyRelease: self.key_release_event,
+            QtCore.QEvent.MouseMove: self.mouse_move_event,
+            QtCore.QEvent.MouseButtonPress: self.mouse_press_event,
+            # QWidget delivers the second press of a double click as its own event
+            QtCore.QEvent.MouseButtonDblClick: self.mouse_press_event,
+            QtCore.QEvent.MouseButtonRelease: self.mouse_release_event,
+            QtCore.QEvent.Wheel: self.mouse_wheel_event,
+            QtCore.QEvent.Close: self.close_event,
+            QtCore.QEvent.Show: self.show_event,
+            QtCore.QEvent.Hide: self.hide_event,
+        })
+        self._widget.installEventFilter(self._event_filter)
 
         # Attach to the context
         self.init_mgl_context()
 
+        # Bind the calls made by swap_buffers every frame up front.
+        # In single buffer mode there is nothing to swap. We just make sure
+        # the frame reaches the front buffer.
+        self._present = self._ctx.finish if self._single_buffer else self._widget.swapBuffers
+        self._process_events = self._app.processEvents
+        # Bounds the wait for events while the window is hidden
+        self._wake_timer = QtCore.QTimer()
+        self._wake_timer.setSingleShot(True)
+
         # Ensure retina and 4k displays get the right viewport
-        self._buffer_width = self._width * self._widget.devicePixelRatio()
-        self._buffer_height = self._height * self._widget.devicePixelRatio()
+        self._buffer_width = self._width * self._dpr
+        self._buffer_height = self._height * self._dpr
 
         self.set_default_viewport()
 
@@ -151,10 +211,20 @@ class Window(BaseWindow):
         self._widget.setGeometry(value[0], value[1], self._width, self._height)
 
     def swap_buffers(self) -> None:
-        """Swap buffers, set viewport, trigger events and increment frame counter"""
-        self._widget.swapBuffers()
-        self.set_default_viewport()
-        self._app.processEvents()
+        """Swap buffers, trigger events and increment frame counter.
+
+        While the window is hidden nothing is presented. Instead we wait for
+        the next event, at most ``_HIDDEN_WAIT_TIME`` milliseconds, so the
+        render loop doesn't spin.
+        """
+        if self._exposed:
+            self._present()
+        else:
+            self._wake_timer.start(self._HIDDEN_WAIT_TIME)
+            self._process_events(QtCore.QEventLoop.AllEvents | QtCore.QEventLoop.WaitForMoreEvents)
+        self._process_events(QtCore.QEventLoop.AllEvents, self.event_time_budget)
+        if self._pending_mouse_pos is not None:
+            self._dispatch_mouse_position()
         self._frames += 1
 
     @property
@@ -199,8 +269,12 @@ class Window(BaseWindow):
             width: New window width
             height: New window height
         """
-        self._width = width // self._widget.devicePixelRatio()
-        self._height = height // self._widget.devicePixelRatio()
+        size = width // self._dpr, height // self._dpr
+        # Qt also calls resizeGL on show and screen changes without the size changing
+        if size == self.size and (width, height) == self.buffer_size:
+            return
+
+        self._width, self._height = size
         self._buffer_width = width
         self._buffer_height = height
 
@@ -210,11 +284,26 @@ class Window(BaseWindow):
         # Make sure we notify the example about the resize
         super().resize(self._buffer_width, self._buffer_height)
 
+    def _screen_changed(self, screen) -> None:
+        """Refresh the cached device pixel ratio when the window moves to another screen.
+
+        Args:
+            screen (QScreen): The new screen
+        """
+        dpr = self._widget.devicePixelRatio()
+        if dpr == self._dpr:
+            return
+
+        self._dpr = dpr
+        self.resize(self._widget.width() * dpr, self._widget.height() * dpr)
+
     def _handle_modifiers(self, mods) -> None:
         """Update modifiers"""
-        self._modifiers.shift = bool(mods & QtCore.Qt.ShiftModifier)
-        self._modifiers.ctrl = bool(mods & QtCore.Qt.ControlModifier)
-        self._modifiers.alt = bool(mods & QtCore.Qt.AltModifier)
+        mods = int(mods)
+        modifiers = self._modifiers
+        modifiers.shift = bool(mods & self._SHIFT_MASK)
+        modifiers.ctrl = bool(mods & self._CTRL_MASK)
+        modifiers.alt = bool(mods & self._ALT_MASK)
 
     def _set_icon(self, icon_path: str) -> None:
         self._widget.setWindowIcon(QtGui.QIcon(icon_path))
@@ -225,18 +314,19 @@ class Window(BaseWindow):
         Args:
             event: The qtevent instance
         """
-        if self._exit_key is not None and event.key() == self._exit_key:
+        key = event.key()
+        if self._exit_key is not None and key == self._exit_key:
             self.close()
 
-        if self._fs_key is not None and event.key() == self._fs_key:
+        if self._fs_key is not None and key == self._fs_key:
             self.fullscreen = not self.fullscreen
 
         self._handle_modifiers(event.modifiers())
-        self._key_pressed_map[event.key()] = True
-        self._key_event_func(event.key(), self.keys.ACTION_PRESS, self._modifiers)
+        self._key_pressed_map[key] = True
+        self._key_event_func(key, self.keys.ACTION_PRESS, self._modifiers)
 
         text = event.text()
-        if text.strip() or event.key() == self.keys.SPACE:
+        if text.strip() or key == self.keys.SPACE:
             self._unicode_char_entered_func(text)
 
     def key_release_event(self, event) -> None:
@@ -245,17 +335,26 @@ class Window(BaseWindow):
         Args:
             event: The qtevent instance
         """
+        key = event.key()
         self._handle_modifiers(event.modifiers())
-        self._key_pressed_map[event.key()] = False
-        self._key_event_func(event.key(), self.keys.ACTION_RELEASE, self._modifiers)
+        self._key_pressed_map[key] = False
+        self._key_event_func(key, self.keys.ACTION_RELEASE, self._modifiers)
 
     def mouse_move_event(self, event) -> None:
-        """Forward mouse cursor position events to standard methods
+        """Buffer mouse cursor position events.
+
+        Only the latest position is forwarded to standard methods
+        once per frame in :py:meth:`swap_buffers`.
 
         Args:
             event: The qtevent instance
         """
-        x, y = event.x(), event.y()
+        self._pending_mouse_pos = event.x(), event.y()
+
+    def _dispatch_mouse_position(self) -> None:
+        """Forward the buffered mouse position to standard methods"""
+        x, y = self._pending_mouse_pos
+        self._pending_mouse_pos = None
         dx, dy = self._calc_mouse_delta(x, y)
 
         if self.mouse_states.any:
@@ -269,9 +368,13 @@ class Window(BaseWindow):
         Args:
             event: The qtevent instance
         """
+        # Flush buffered movement so it is reported before the button state changes
+        if self._pending_mouse_pos is not None:
+            self._dispatch_mouse_position()
+
         self._handle_modifiers(event.modifiers())
-        button = self._mouse_button_map.get(event.button())
-        if button is None:
+        button = self._mouse_button_lut[event.button() & 7]
+        if not button:
             return
 
         self._handle_mouse_button_state_change(button, True)
@@ -283,9 +386,13 @@ class Window(BaseWindow):
         Args:
             event: The qtevent instance
         """
+        # Flush buffered movement so it is reported before the button state changes
+        if self._pending_mouse_pos is not None:
+            self._dispatch_mouse_position()
+
         self._handle_modifiers(event.modifiers())
-        button = self._mouse_button_map.get(event.button())
-        if button is None:
+        button = self._mouse_button_lut[event.button() & 7]
+        if not button:
             return
 
         self._handle_mouse_button_state_change(button, False)
@@ -314,7 +421,8 @@ class Window(BaseWindow):
         """
         self._handle_modifiers(event.modifiers())
         point = event.angleDelta()
-        self._mouse_scroll_event_func(point.x() / 120.0, point.y() / 120.0)
+        scale = self._WHEEL_SCALE
+        self._mouse_scroll_event_func(point.x() * scale, point.y() * scale)
 
     def close_event(self, event) -> None:
         """The standard PyQt close events
@@ -331,12 +439,22 @@ class Window(BaseWindow):
 
     def show_event(self, event):
         """The standard Qt show event"""
+        self._exposed = True
         self._iconify_func(False)
 
     def hide_event(self, event):
         """The standard Qt hide event"""
+        self._exposed = False
         self._iconify_func(True)
 
     def destroy(self) -> None:
-        """Quit the Qt application to exit the window gracefully"""
-        QtCore.QCoreApplication.instance().quit()
+        """Quit the Qt application to exit the window gracefully.
+
+        An application owned by the host process is left running.
+        """
+        if self._owns_app:
+            self._app.quit()
+        else:
+            # Stop forwarding events so closing doesn't trigger our callbacks again
+            self._widget.removeEventFilter(self._event_filter)
+            self._widget.close()
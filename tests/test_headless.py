@@ -33,6 +33,7 @@ class HeadlessWindowTestCase(HeadlessTestCase):
         self.assertEqual(self.window.vsync, False)
         self.assertEqual(self.window.aspect_ratio, 1.0)
         self.assertEqual(self.window.samples, 0)
+        self.assertEqual(self.window.single_buffer, False)
         self.assertEqual(self.window.cursor, False)
         self.assertIsNotNone(self.window.modifiers)
         self.assertFalse(self.window.is_closing)
@@ -51,6 +52,16 @@ class HeadlessWindowTestCase(HeadlessTestCase):
         self.window.print_context_info()
         self.assertFalse(self.window.is_key_pressed(self.window.keys.ESCAPE))
 
+    def test_is_any_pressed(self):
+        """Headless has no key constants, so use plain key codes"""
+        self.assertFalse(self.window.is_any_pressed([]))
+        self.assertFalse(self.window.is_any_pressed([1, 2]))
+        self.window._key_pressed_map[2] = True
+        try:
+            self.assertTrue(self.window.is_any_pressed([1, 2]))
+        finally:
+            self.window._key_pressed_map[2] = False
+
     def test_resize(self):
         """Resize should do nothing"""
         self.window.resize(16, 16)
@@ -36,3 +36,9 @@ class ModernGlWindowTestCase(TestCase):
 
         self.assertIsInstance(mglw.window(), BaseWindow)
         self.assertIsInstance(mglw.ctx(), moderngl.Context)
+
+    def test_parse_args_single_buffer(self):
+        """Single buffering is off unless requested"""
+        self.assertIsNone(mglw.parse_args(args=['-wnd', 'headless']).single_buffer)
+        values = mglw.parse_args(args=['-wnd', 'headless', '--single_buffer', 'true'])
+        self.assertTrue(values.single_buffer)